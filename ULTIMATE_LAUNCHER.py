@@ -38,6 +38,12 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from core.improved_trading_system import ImprovedTradingSystem
 from core.simple_binance_connector import SimpleBinanceConnector, SimpleScalpingSignals
 
+try:
+    import uvloop  # libuv-based event loop for the aiohttp dashboard/websockets
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # AI and ML imports
 try:
     from ai.deep_learning_engine import DeepLearningTradingEngine, OnlineLearningEngine
@@ -86,6 +92,9 @@ class UltimateAutomatedTradingSystem:
         self.is_running = False
         self.start_time = datetime.now()
         
+        # Last prediction per symbol awaiting its dashboard outcome: (signal, confidence, price)
+        self.pending_predictions = {}
+        
         # Performance tracking
         self.system_metrics = {
             'uptime': 0,
@@ -250,14 +259,30 @@ class UltimateAutomatedTradingSystem:
                                 timestamp=time.time()
                             )
                 
+                # Score last cycle's predictions for the dashboard's accuracy metrics
+                self._record_prediction_outcomes()
+                
                 # Generate AI predictions
                 for symbol in self.trading_system.symbols:
                     prediction = await self.ai_engine.predict_signal(symbol)
                     if prediction:
                         self.system_metrics['ai_predictions'] += 1
                         
+                        price = self._latest_price(symbol)
+                        if price and self.dashboard and hasattr(self.dashboard, 'record_prediction_outcome'):
+                            self.pending_predictions[symbol] = (prediction.signal, prediction.confidence, price)
+                        
                         # Store prediction for dashboard (only if dashboard supports AI)
-                        if self.dashboard and hasattr(self.dashboard, 'ai_predictions'):
+                        if self.dashboard and hasattr(self.dashboard, 'add_prediction'):
+                            self.dashboard.add_prediction(
+                                symbol,
+                                prediction.signal,
+                                prediction.confidence,
+                                prediction.probability_buy,
+                                prediction.probability_sell,
+                                prediction.timestamp
+                            )
+                        elif self.dashboard and hasattr(self.dashboard, 'ai_predictions'):
                             self.dashboard.ai_predictions.append({
                                 'symbol': symbol,
                                 'signal': prediction.signal,
@@ -283,6 +308,20 @@ class UltimateAutomatedTradingSystem:
                 self.system_metrics['errors_handled'] += 1
                 await asyncio.sleep(10)
     
+    def _latest_price(self, symbol: str):
+        """Most recent price seen by the scalping engine, or None"""
+        prices = self.trading_system.scalping_engine.price_history.get(symbol)
+        return prices[-1] if prices else None
+    
+    def _record_prediction_outcomes(self):
+        """Hand each pending prediction and the price since then to the dashboard (metrics only, no model feedback)"""
+        for symbol, (predicted, confidence, entry_price) in self.pending_predictions.items():
+            price = self._latest_price(symbol)
+            if price:
+                self.dashboard.record_prediction_outcome(symbol, predicted, confidence, entry_price, price)
+        
+        self.pending_predictions.clear()
+    
     async def _system_monitoring_loop(self):
         """System-wide monitoring and automation loop"""
         self.logger.info("📊 Starting system monitoring loop...")
@@ -678,6 +717,10 @@ async def main():
         return 1
 
 if __name__ == "__main__":
+    # Install before asyncio.run() creates the loop
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
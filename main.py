@@ -19,6 +19,12 @@ import os
 import argparse
 from pathlib import Path
 
+try:
+    import uvloop  # libuv-based event loop for the aiohttp dashboard/websockets
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -260,6 +266,10 @@ async def main():
         return 1
 
 if __name__ == "__main__":
+    # Install before asyncio.run() creates the loop
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
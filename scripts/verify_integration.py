@@ -135,6 +135,9 @@ def check_config_files():
     try:
         import yaml
         
+        # libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        
         config_files = [
             "config/trading_config.yaml",
             "config/risk_config.yaml",
@@ -145,7 +148,7 @@ def check_config_files():
             if Path(config_file).exists():
                 try:
                     with open(config_file, 'r') as f:
-                        yaml.safe_load(f)
+                        yaml.load(f, Loader=loader)
                     print(f"✅ {config_file}")
                 except Exception as e:
                     errors.append(f"❌ Invalid YAML in {config_file}: {e}")
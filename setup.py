@@ -3,8 +3,62 @@
 Setup script for Ultra-Fast Scalping Trading System
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
+from setuptools.command.build_py import build_py
 from pathlib import Path
+import gzip
+
+
+class OptionalBuildExt(build_ext):
+    """Native helpers are optional - the Python fallbacks are used without a compiler"""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            print(f"⚠️ Skipping native extensions: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"⚠️ Failed to build {ext.name}: {e}")
+
+
+class PrecompressBuildPy(build_py):
+    """Ship .gz/.br siblings of the dashboard pages - FileResponse serves them by Accept-Encoding"""
+
+    STATIC_DIRS = ('src/ui/static', 'src/utils/static')
+
+    def run(self):
+        super().run()
+        try:
+            import brotli
+        except ImportError:
+            brotli = None
+
+        for static_dir in self.STATIC_DIRS:
+            for page in Path(self.build_lib, static_dir).glob('*.html'):
+                raw = page.read_bytes()
+                page.with_name(page.name + '.gz').write_bytes(gzip.compress(raw, 9))
+                if brotli is not None:
+                    page.with_name(page.name + '.br').write_bytes(brotli.compress(raw, quality=11))
+
+
+# Native helpers loaded through ctypes by src/optimizations
+ext_modules = [
+    Extension(
+        'src.optimizations._prefetch',
+        sources=['src/optimizations/_prefetch.c'],
+        extra_compile_args=['-O2', '-msse'],
+    ),
+    Extension(
+        'src.optimizations._spsc_ring',
+        sources=['src/optimizations/_spsc_ring.c'],
+        extra_compile_args=['-O2', '-std=c11'],
+    ),
+]
 
 # Read README
 this_directory = Path(__file__).parent
@@ -36,6 +90,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/ultrafast-trading/scalping-system",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': OptionalBuildExt, 'build_py': PrecompressBuildPy},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Financial and Insurance Industry",
@@ -69,6 +125,8 @@ setup(
         'config': ['*.yaml', '*.yml'],
         'docs': ['*.md'],
         'examples': ['*.py'],
+        'src.ui': ['static/*.html'],
+        'src.utils': ['static/*.html'],
     },
     project_urls={
         "Bug Reports": "https://github.com/ultrafast-trading/scalping-system/issues",
@@ -12,7 +12,7 @@ import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict
 from dotenv import load_dotenv
@@ -31,6 +31,11 @@ class SimplePosition:
     entry_time: datetime
     stop_loss: float
     take_profit: float
+    entry_time_iso: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # entry_time never changes: format once for dashboard payloads
+        self.entry_time_iso = self.entry_time.isoformat()
     
     def update_pnl(self, current_price: float):
         self.current_price = current_price
@@ -108,6 +113,7 @@ class ImprovedTradingSystem:
         # Trading state
         self.is_trading = False
         self.positions: Dict[str, SimplePosition] = {}
+        self.open_pnl = 0.0  # Running sum of position P&L, maintained on write
         self.risk_manager = None
         
         # Performance tracking
@@ -156,9 +162,12 @@ class ImprovedTradingSystem:
     async def _on_tick(self, tick: SimpleTick):
         """Process incoming tick data"""
         try:
-            # Update positions
-            if tick.symbol in self.positions:
-                self.positions[tick.symbol].update_pnl(tick.price)
+            # Update positions (unchanged price: pnl and open_pnl already current)
+            position = self.positions.get(tick.symbol)
+            if position is not None and tick.price != position.current_price:
+                previous_pnl = position.pnl
+                position.update_pnl(tick.price)
+                self.open_pnl += position.pnl - previous_pnl
                 
                 # Notify dashboard of position update if it exists
                 if hasattr(self, 'dashboard'):
@@ -196,7 +205,7 @@ class ImprovedTradingSystem:
                     'symbol': symbol,
                     'signal_type': signal['signal_type'],
                     'strength': signal['strength'],
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns() // 1_000_000  # epoch ms; the browser formats it
                 }
                 self.dashboard.signal_history.append(signal_data)
         except Exception as e:
@@ -285,6 +294,13 @@ class ImprovedTradingSystem:
         except Exception as e:
             self.logger.error(f"❌ Error checking exits: {e}")
     
+    def _remove_position(self, symbol: str):
+        """Drop a position and take its P&L out of the running aggregate"""
+        position = self.positions.pop(symbol)
+        self.open_pnl -= position.pnl
+        if not self.positions:
+            self.open_pnl = 0.0  # Shed accumulated float drift
+    
     async def _close_position(self, symbol: str, reason: str):
         """Close position with better error handling"""
         try:
@@ -322,7 +338,7 @@ class ImprovedTradingSystem:
                         self.logger.debug(f"AI training error: {e}")
                 
                 # Remove position
-                del self.positions[symbol]
+                self._remove_position(symbol)
                 
                 self.logger.info(f"✅ POSITION CLOSED: {symbol}")
                 self.logger.info(f"   P&L: ${final_pnl:.2f}")
@@ -337,7 +353,7 @@ class ImprovedTradingSystem:
                 if "emergency" in reason.lower() or "shutdown" in reason.lower():
                     final_pnl = position.pnl
                     self.risk_manager.update_balance(final_pnl)
-                    del self.positions[symbol]
+                    self._remove_position(symbol)
                     self.logger.warning(f"⚠️ POSITION FORCE CLOSED: {symbol} (P&L: ${final_pnl:.2f})")
                 
         except Exception as e:
@@ -348,7 +364,7 @@ class ImprovedTradingSystem:
                 position = self.positions[symbol]
                 final_pnl = position.pnl
                 self.risk_manager.update_balance(final_pnl)
-                del self.positions[symbol]
+                self._remove_position(symbol)
                 self.logger.warning(f"⚠️ POSITION EMERGENCY CLOSED: {symbol} (P&L: ${final_pnl:.2f})")
     
     async def start_trading(self):
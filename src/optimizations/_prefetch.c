@@ -0,0 +1,31 @@
+/*
+ * SOFTWARE PREFETCH HELPERS
+ * =========================
+ * Thin wrappers around the compiler prefetch intrinsics so Python code can
+ * issue real PREFETCHT0 / PREFETCHNTA instructions. Loaded through ctypes
+ * by memory_pool_optimizer (build with: python setup.py build_ext --inplace).
+ */
+
+#if defined(__SSE__)
+#include <xmmintrin.h>
+#endif
+
+/* Pull the cache line at p into all cache levels (L1 and up). */
+void prefetch_t0(const void *p)
+{
+#if defined(__SSE__)
+    _mm_prefetch((const char *)p, _MM_HINT_T0);
+#else
+    __builtin_prefetch(p, 0, 3);
+#endif
+}
+
+/* Non-temporal prefetch: bring the line close without polluting the caches. */
+void prefetch_nta(const void *p)
+{
+#if defined(__SSE__)
+    _mm_prefetch((const char *)p, _MM_HINT_NTA);
+#else
+    __builtin_prefetch(p, 0, 0);
+#endif
+}
@@ -9,6 +9,7 @@ ADVANCED OPTIMIZATIONS - NEXT LEVEL ENHANCEMENTS
 
 import asyncio
 import aiohttp
+import heapq
 import time
 import numpy as np
 import pandas as pd
@@ -64,8 +65,7 @@ class IntelligentRateLimiter:
             current_time = time.time()
             
             # Clean old requests (older than 1 minute)
-            while self.request_times and current_time - self.request_times[0] > 60:
-                self.request_times.popleft()
+            self._prune_request_times(current_time)
             
             # Check if we can make the request
             if len(self.request_times) + weight <= self.requests_per_minute:
@@ -87,6 +87,11 @@ class IntelligentRateLimiter:
             
             return False
     
+    def _prune_request_times(self, current_time: float):
+        """Drop requests older than 1 minute (request_times is in time order)"""
+        while self.request_times and current_time - self.request_times[0] > 60:
+            self.request_times.popleft()
+    
     async def acquire_burst(self, count: int) -> bool:
         """Acquire burst capacity for high-frequency operations"""
         if self.burst_count + count <= self.burst_limit:
@@ -104,7 +109,10 @@ class IntelligentRateLimiter:
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """Get current rate limit status"""
         current_time = time.time()
-        recent_requests = sum(1 for t in self.request_times if current_time - t < 60)
+        
+        # After pruning, the window length is the recent request count (no scan)
+        self._prune_request_times(current_time)
+        recent_requests = len(self.request_times)
         
         return {
             'requests_used': recent_requests,
@@ -521,10 +529,11 @@ class EnhancedMicrostructureAnalyzer:
         cumulative_sizes = []
         cumulative_size = 0
         
-        sorted_orders = sorted(orders, key=lambda x: x[0], 
-                             reverse=(side == 'bid'))
+        # Only the top 10 levels are used; select them without a full sort
+        select_top = heapq.nlargest if side == 'bid' else heapq.nsmallest
+        top_levels = select_top(10, orders, key=lambda x: x[0])
         
-        for price, size in sorted_orders[:10]:  # Top 10 levels
+        for price, size in top_levels:
             price_distance = abs(price - best_price) / best_price * 100
             cumulative_size += size
             price_levels.append(price_distance)
@@ -867,7 +876,7 @@ class AdvancedPortfolioOptimizer:
             return {}
         
         # Expected returns (based on signal strength)
-        expected_returns = np.array([signals[symbol] for symbol in symbols])
+        expected_returns = np.fromiter(signals.values(), dtype=float, count=n_assets)
         
         # Risk model (simplified)
         if correlations.shape[0] != n_assets:
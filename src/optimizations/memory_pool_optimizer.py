@@ -8,16 +8,124 @@ ADVANCED MEMORY POOL OPTIMIZER
 """
 
 import os
+import sys
 import mmap
 import ctypes
+import importlib.machinery
 import numpy as np
 from typing import Dict, List, Any, Optional
-import multiprocessing as mp
 from multiprocessing import shared_memory
 from dataclasses import dataclass
 import threading
 import time
 
+def _load_native(name: str):
+    """Load a compiled helper built by setup.py (build_ext --inplace)"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES:
+        path = os.path.join(base_dir, name + suffix)
+        if os.path.exists(path):
+            try:
+                return ctypes.CDLL(path)
+            except OSError:
+                return None
+    return None
+
+# Real software prefetch (PREFETCHT0) from the native helper
+_prefetch_lib = _load_native('_prefetch')
+if _prefetch_lib is not None:
+    _prefetch_lib.prefetch_t0.argtypes = [ctypes.c_void_p]
+    _prefetch_lib.prefetch_t0.restype = None
+    _prefetch_lib.prefetch_nta.argtypes = [ctypes.c_void_p]
+    _prefetch_lib.prefetch_nta.restype = None
+PREFETCH_AVAILABLE = _prefetch_lib is not None
+
+# C11-atomics SPSC ring from the native helper
+_spsc_lib = _load_native('_spsc_ring')
+if _spsc_lib is not None:
+    _spsc_lib.spsc_create.argtypes = [ctypes.c_uint64]
+    _spsc_lib.spsc_create.restype = ctypes.c_void_p
+    _spsc_lib.spsc_destroy.argtypes = [ctypes.c_void_p]
+    _spsc_lib.spsc_destroy.restype = None
+    _spsc_lib.push_double.argtypes = [ctypes.c_void_p, ctypes.c_double]
+    _spsc_lib.push_double.restype = ctypes.c_int
+    _spsc_lib.pop_double.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_double)]
+    _spsc_lib.pop_double.restype = ctypes.c_int
+    _spsc_lib.push_bulk.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64]
+    _spsc_lib.push_bulk.restype = ctypes.c_uint64
+    _spsc_lib.pop_bulk.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64]
+    _spsc_lib.pop_bulk.restype = ctypes.c_uint64
+    _spsc_lib.spsc_size.argtypes = [ctypes.c_void_p]
+    _spsc_lib.spsc_size.restype = ctypes.c_uint64
+SPSC_AVAILABLE = _spsc_lib is not None
+
+# Huge page support (2MB pages cut TLB misses on the large tick pool)
+HUGE_PAGE_SIZE = 2 * 1024 * 1024
+MAP_HUGETLB = getattr(mmap, 'MAP_HUGETLB', 0x40000)
+MAP_POPULATE = getattr(mmap, 'MAP_POPULATE', 0x8000 if sys.platform.startswith('linux') else 0)
+
+# Native aligned allocation via libc
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _libc.posix_memalign.argtypes = [
+        ctypes.POINTER(ctypes.c_void_p), ctypes.c_size_t, ctypes.c_size_t
+    ]
+    _libc.posix_memalign.restype = ctypes.c_int
+    _libc.free.argtypes = [ctypes.c_void_p]
+    _libc.free.restype = None
+    POSIX_MEMALIGN_AVAILABLE = True
+except (OSError, AttributeError):
+    _libc = None
+    POSIX_MEMALIGN_AVAILABLE = False
+
+# NUMA placement via libnuma (optional)
+try:
+    _libnuma = ctypes.CDLL("libnuma.so.1")
+    _libnuma.numa_available.restype = ctypes.c_int
+    _libnuma.numa_max_node.restype = ctypes.c_int
+    _libnuma.numa_alloc_onnode.argtypes = [ctypes.c_size_t, ctypes.c_int]
+    _libnuma.numa_alloc_onnode.restype = ctypes.c_void_p
+    _libnuma.numa_free.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    _libnuma.numa_free.restype = None
+    _libnuma.numa_run_on_node.argtypes = [ctypes.c_int]
+    _libnuma.numa_run_on_node.restype = ctypes.c_int
+    _libnuma.numa_node_of_cpu.argtypes = [ctypes.c_int]
+    _libnuma.numa_node_of_cpu.restype = ctypes.c_int
+    NUMA_AVAILABLE = _libnuma.numa_available() >= 0
+except (OSError, AttributeError):
+    _libnuma = None
+    NUMA_AVAILABLE = False
+
+class _AlignedAllocation:
+    """Owner of a native block, freed when the last view is released"""
+    
+    def __init__(self, address: int, size: int = 0, numa: bool = False):
+        self.address = address
+        self.size = size
+        self.numa = numa
+    
+    def __del__(self):
+        if not self.address:
+            return
+        if self.numa:
+            if _libnuma is not None:
+                _libnuma.numa_free(self.address, self.size)
+        elif _libc is not None:
+            _libc.free(self.address)
+        self.address = 0
+
+# Packed tick record for the mmap tape: 16 bytes (4 per cache line).
+# Prices are stored as int16 tick deltas against the symbol's last price;
+# a KEYFRAME record (sym | TICK_KEYFRAME_FLAG) carries the absolute float64
+# price in its 'ts' field and resets the base.
+PACKED_TICK_DTYPE = np.dtype([
+    ('ts', 'u8'),
+    ('price_delta', 'i2'),
+    ('size', 'f4'),
+    ('sym', 'u2')
+])
+TICK_KEYFRAME_FLAG = 0x8000
+
 @dataclass
 class MemoryPool:
     """Memory pool configuration"""
@@ -29,9 +137,32 @@ class MemoryPool:
 class ZeroAllocTradingEngine:
     """Zero-allocation trading engine with pre-allocated pools"""
     
-    def __init__(self, max_symbols: int = 50, max_ticks_per_symbol: int = 10000):
+    __slots__ = (
+        'max_symbols', 'max_ticks_per_symbol', 'numa_node', 'memory_pools',
+        'total_memory_mb', 'tick_buffers', 'performance_counters', '_sym_name_to_idx'
+    )
+    
+    # Counter indices
+    COUNTER_TICKS_PROCESSED = 0
+    COUNTER_SIGNALS_GENERATED = 1
+    COUNTER_ORDERS_SENT = 2
+    COUNTER_CACHE_HITS = 3
+    COUNTER_CACHE_MISSES = 4
+    
+    # Gather order used for stats snapshots
+    STATS_COUNTER_INDEX = np.array([
+        COUNTER_TICKS_PROCESSED, COUNTER_SIGNALS_GENERATED, COUNTER_ORDERS_SENT,
+        COUNTER_CACHE_HITS, COUNTER_CACHE_MISSES
+    ], dtype=np.intp)
+    
+    def __init__(self, max_symbols: int = 50, max_ticks_per_symbol: int = 10000,
+                 numa_node: int = 0):
         self.max_symbols = max_symbols
         self.max_ticks_per_symbol = max_ticks_per_symbol
+        self.numa_node = numa_node
+        
+        # Run on the same node the pools are placed on
+        self._bind_to_numa_node()
         
         # Pre-allocate all memory pools
         self._setup_memory_pools()
@@ -43,6 +174,19 @@ class ZeroAllocTradingEngine:
         print(f"   Memory pools: {len(self.memory_pools)}")
         print(f"   Total allocated: {self.total_memory_mb:.1f}MB")
     
+    @staticmethod
+    def _numa_node_valid(node: int) -> bool:
+        """Check the node exists on this host"""
+        return NUMA_AVAILABLE and 0 <= node <= _libnuma.numa_max_node()
+    
+    def _bind_to_numa_node(self):
+        """Restrict the processing thread to the pools' NUMA node"""
+        if not self._numa_node_valid(self.numa_node):
+            return
+        
+        if _libnuma.numa_run_on_node(self.numa_node) != 0:
+            print(f"   ⚠️ Could not run on NUMA node {self.numa_node}")
+    
     def _setup_memory_pools(self):
         """Setup pre-allocated memory pools"""
         self.memory_pools = {}
@@ -50,41 +194,40 @@ class ZeroAllocTradingEngine:
         
         # Pool 1: Tick data (hot path)
         tick_pool_size = self.max_symbols * self.max_ticks_per_symbol * 64  # 64 bytes per tick
-        self.memory_pools['ticks'] = self._create_aligned_pool('ticks', tick_pool_size, 64)
+        self.memory_pools['ticks'] = self._create_aligned_pool(
+            MemoryPool('ticks', tick_pool_size, 64, self.numa_node)
+        )
         
         # Pool 2: Order book data
         book_pool_size = self.max_symbols * 40 * 32  # 40 levels, 32 bytes per level
-        self.memory_pools['orderbook'] = self._create_aligned_pool('orderbook', book_pool_size, 64)
+        self.memory_pools['orderbook'] = self._create_aligned_pool(
+            MemoryPool('orderbook', book_pool_size, 64, self.numa_node)
+        )
         
         # Pool 3: Signal data
         signal_pool_size = self.max_symbols * 1000 * 128  # 1000 signals, 128 bytes each
-        self.memory_pools['signals'] = self._create_aligned_pool('signals', signal_pool_size, 64)
+        self.memory_pools['signals'] = self._create_aligned_pool(
+            MemoryPool('signals', signal_pool_size, 64, self.numa_node)
+        )
         
         # Pool 4: Performance counters (cache-aligned)
         counter_pool_size = 1024 * 64  # 1024 counters, 64 bytes each
-        self.memory_pools['counters'] = self._create_aligned_pool('counters', counter_pool_size, 64)
+        self.memory_pools['counters'] = self._create_aligned_pool(
+            MemoryPool('counters', counter_pool_size, 64, self.numa_node)
+        )
     
-    def _create_aligned_pool(self, name: str, size: int, alignment: int) -> np.ndarray:
+    def _create_aligned_pool(self, pool: MemoryPool) -> np.ndarray:
         """Create cache-aligned memory pool"""
+        name, size, alignment = pool.name, pool.size, pool.alignment
         try:
-            # Allocate extra memory for alignment
-            raw_size = size + alignment - 1
-            raw_memory = np.empty(raw_size, dtype=np.uint8)
-            
-            # Calculate aligned address
-            raw_address = raw_memory.ctypes.data
-            aligned_address = (raw_address + alignment - 1) & ~(alignment - 1)
-            offset = aligned_address - raw_address
-            
-            # Create aligned view
-            aligned_memory = raw_memory[offset:offset + size]
+            aligned_memory, backing = self._allocate_aligned(size, alignment, pool.numa_node)
             
             # Pre-fault all pages
             self._prefault_memory(aligned_memory)
             
             self.total_memory_mb += size / (1024 * 1024)
             
-            print(f"   ✅ Pool '{name}': {size / 1024:.1f}KB (aligned to {alignment} bytes)")
+            print(f"   ✅ Pool '{name}': {size / 1024:.1f}KB (aligned to {alignment} bytes, {backing})")
             
             return aligned_memory
             
@@ -92,6 +235,45 @@ class ZeroAllocTradingEngine:
             print(f"❌ Failed to create pool '{name}': {e}")
             return np.empty(size, dtype=np.uint8)
     
+    def _allocate_aligned(self, size: int, alignment: int, numa_node: int = 0):
+        """Allocate memory that starts on an aligned boundary.
+        
+        The returned array owns (keeps alive) its backing allocation, so
+        views created with np.frombuffer stay valid for the pool lifetime.
+        """
+        # NUMA hosts: place the pool on its node (page-aligned)
+        if self._numa_node_valid(numa_node):
+            address = _libnuma.numa_alloc_onnode(size, numa_node)
+            if address:
+                buffer = (ctypes.c_uint8 * size).from_address(address)
+                buffer._owner = _AlignedAllocation(address, size, numa=True)
+                return np.ctypeslib.as_array(buffer), f'numa node {numa_node}'
+        
+        # Large pools: try 2MB huge pages first
+        if size >= HUGE_PAGE_SIZE:
+            mapped_size = (size + HUGE_PAGE_SIZE - 1) & ~(HUGE_PAGE_SIZE - 1)
+            try:
+                huge_map = mmap.mmap(
+                    -1, mapped_size,
+                    flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | MAP_HUGETLB,
+                    prot=mmap.PROT_READ | mmap.PROT_WRITE
+                )
+                return np.frombuffer(huge_map, dtype=np.uint8, count=size), 'hugepages'
+            except (OSError, ValueError):
+                pass  # No huge pages reserved, fall back to normal pages
+        
+        if POSIX_MEMALIGN_AVAILABLE:
+            ptr = ctypes.c_void_p()
+            alignment = max(alignment, ctypes.sizeof(ctypes.c_void_p))
+            if _libc.posix_memalign(ctypes.byref(ptr), alignment, size) == 0 and ptr.value:
+                buffer = (ctypes.c_uint8 * size).from_address(ptr.value)
+                buffer._owner = _AlignedAllocation(ptr.value)
+                return np.ctypeslib.as_array(buffer), 'posix_memalign'
+        
+        # Anonymous mappings are always page-aligned
+        anon_map = mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        return np.frombuffer(anon_map, dtype=np.uint8), 'mmap'
+    
     def _prefault_memory(self, memory: np.ndarray):
         """Pre-fault memory pages to avoid page faults during trading"""
         page_size = 4096  # 4KB pages
@@ -109,28 +291,27 @@ class ZeroAllocTradingEngine:
         """Setup lock-free data structures using memory pools"""
         
         # Tick buffers (using tick pool)
-        self.tick_buffers = {}
         tick_memory = self.memory_pools['ticks']
         bytes_per_tick = 64
         ticks_per_symbol = len(tick_memory) // (self.max_symbols * bytes_per_tick)
         
-        for i in range(self.max_symbols):
-            start_idx = i * ticks_per_symbol * bytes_per_tick
-            end_idx = start_idx + (ticks_per_symbol * bytes_per_tick)
-            symbol_memory = tick_memory[start_idx:end_idx]
-            
-            # Create structured array for ticks
-            tick_dtype = np.dtype([
-                ('price', 'f8'),
-                ('size', 'f8'), 
-                ('timestamp', 'u8'),
-                ('is_buyer', 'b1'),
-                ('padding', 'u1', 39)  # Pad to 64 bytes
-            ])
-            
-            self.tick_buffers[f'symbol_{i}'] = np.frombuffer(
-                symbol_memory, dtype=tick_dtype
-            ).reshape(-1)
+        # Create structured array for ticks (itemsize pads each record to a
+        # 64-byte cache line; the padding bytes are not a field)
+        tick_dtype = np.dtype({
+            'names': ['price', 'size', 'timestamp', 'is_buyer'],
+            'formats': ['f8', 'f8', 'u8', '?'],
+            'offsets': [0, 8, 16, 24],
+            'itemsize': bytes_per_tick
+        })
+        
+        # One contiguous row per symbol: tick_buffers[symbol_idx, tick_idx]
+        used_bytes = self.max_symbols * ticks_per_symbol * bytes_per_tick
+        self.tick_buffers = np.frombuffer(
+            tick_memory[:used_bytes], dtype=tick_dtype
+        ).reshape(self.max_symbols, ticks_per_symbol)
+        
+        # Symbol names are resolved once, administrative paths only
+        self._sym_name_to_idx = {f'symbol_{i}': i for i in range(self.max_symbols)}
         
         # Performance counters (using counter pool)
         counter_memory = self.memory_pools['counters']
@@ -140,13 +321,24 @@ class ZeroAllocTradingEngine:
         
         # Initialize counters
         self.performance_counters.fill(0)
-        
-        # Counter indices
-        self.COUNTER_TICKS_PROCESSED = 0
-        self.COUNTER_SIGNALS_GENERATED = 1
-        self.COUNTER_ORDERS_SENT = 2
-        self.COUNTER_CACHE_HITS = 3
-        self.COUNTER_CACHE_MISSES = 4
+    
+    def resolve_symbol(self, name: str) -> int:
+        """Map a 'symbol_N' name to its tick_buffers row (not for hot paths)"""
+        return self._sym_name_to_idx[name]
+    
+    @property
+    def tick_buffers_by_name(self) -> Dict[str, np.ndarray]:
+        """String-keyed view of tick_buffers for callers using symbol names"""
+        return {name: self.tick_buffers[idx] for name, idx in self._sym_name_to_idx.items()}
+
+# Queue control block layout: producer index, consumer index and the
+# read-only capacity/mask each own a 128-byte slot (two cache lines, so the
+# adjacent-line prefetcher cannot pull head and tail in together)
+CACHE_PAD = 128
+HEAD_OFFSET = 0
+TAIL_OFFSET = CACHE_PAD
+META_OFFSET = 2 * CACHE_PAD
+CONTROL_BLOCK_SIZE = 3 * CACHE_PAD
 
 class LockFreeQueue:
     """Lock-free queue using atomic operations"""
@@ -156,42 +348,150 @@ class LockFreeQueue:
         self.mask = capacity - 1
         assert (capacity & self.mask) == 0, "Capacity must be power of 2"
         
-        # Use shared memory for cross-process access
-        self.buffer = mp.Array('d', capacity)
-        self.head = mp.Value('L', 0)  # Producer index
-        self.tail = mp.Value('L', 0)  # Consumer index
-        
-        # Padding to avoid false sharing
-        self._padding = [0] * 64
+        # Use shared memory for cross-process access (plain NumPy view, no lock)
+        self._shm = shared_memory.SharedMemory(create=True, size=capacity * 8)
+        self.buffer = np.ndarray((capacity,), dtype=np.float64, buffer=self._shm.buf)
+        
+        # Head/tail live on separate cache lines of a shared control block
+        self._control = shared_memory.SharedMemory(create=True, size=CONTROL_BLOCK_SIZE)
+        self.head = np.ndarray((1,), dtype=np.uint64, buffer=self._control.buf,
+                               offset=HEAD_OFFSET)  # Producer index
+        self.tail = np.ndarray((1,), dtype=np.uint64, buffer=self._control.buf,
+                               offset=TAIL_OFFSET)  # Consumer index
+        self.meta = np.ndarray((2,), dtype=np.uint64, buffer=self._control.buf,
+                               offset=META_OFFSET)  # Capacity, mask
+        self.head[0] = 0
+        self.tail[0] = 0
+        self.meta[:] = (capacity, self.mask)
+        
+        # False-sharing padding is enforced by the control block layout
+        # (HEAD_OFFSET / TAIL_OFFSET / META_OFFSET, CACHE_PAD apart)
     
     def enqueue(self, item: float) -> bool:
         """Enqueue item (returns False if full)"""
-        current_head = self.head.value
+        current_head = int(self.head[0])
         next_head = (current_head + 1) & self.mask
         
-        if next_head == self.tail.value:
+        if next_head == self.tail[0]:
             return False  # Queue full
         
         self.buffer[current_head] = item
         
         # Memory barrier (store-store)
-        self.head.value = next_head
+        self.head[0] = next_head
         
         return True
     
     def dequeue(self) -> Optional[float]:
         """Dequeue item (returns None if empty)"""
-        current_tail = self.tail.value
+        current_tail = int(self.tail[0])
         
-        if current_tail == self.head.value:
+        if current_tail == self.head[0]:
             return None  # Queue empty
         
-        item = self.buffer[current_tail]
+        item = float(self.buffer[current_tail])
         
         # Memory barrier (load-store)
-        self.tail.value = (current_tail + 1) & self.mask
+        self.tail[0] = (current_tail + 1) & self.mask
         
         return item
+    
+    def enqueue_bulk(self, values: np.ndarray) -> int:
+        """Enqueue as many values as fit with one copy and one head publish.
+        
+        Returns the number of values enqueued.
+        """
+        current_head = int(self.head[0])
+        free_slots = (int(self.tail[0]) - current_head - 1) & self.mask
+        n = min(values.size, free_slots)
+        if n == 0:
+            return 0
+        
+        end = current_head + n
+        if end <= self.capacity:
+            np.copyto(self.buffer[current_head:end], values[:n])
+        else:
+            # Split at the wrap point
+            split = self.capacity - current_head
+            np.copyto(self.buffer[current_head:], values[:split])
+            np.copyto(self.buffer[:n - split], values[split:n])
+        
+        # Memory barrier (store-store)
+        self.head[0] = end & self.mask
+        
+        return n
+    
+    def size(self) -> int:
+        """Number of queued items"""
+        return (int(self.head[0]) - int(self.tail[0])) & self.mask
+    
+    def close(self):
+        """Release the shared buffer and control block"""
+        if self._control is None:
+            return
+        
+        # Views must be dropped before the segments can be closed
+        self.buffer = self.head = self.tail = self.meta = None
+        for segment in (self._shm, self._control):
+            segment.close()
+            segment.unlink()
+        self._shm = self._control = None
+
+class NativeSPSCRing:
+    """SPSC ring of doubles backed by the _spsc_ring C helper.
+    
+    Same interface as LockFreeQueue for one producer and one consumer thread
+    in this process, with real acquire/release ordering. Every call crosses
+    the ctypes boundary, so hot paths should use the bulk methods.
+    """
+    
+    def __init__(self, capacity: int):
+        if not SPSC_AVAILABLE:
+            raise RuntimeError("_spsc_ring extension not built (python setup.py build_ext --inplace)")
+        
+        self.capacity = capacity
+        self.mask = capacity - 1
+        assert (capacity & self.mask) == 0, "Capacity must be power of 2"
+        
+        self._ring = _spsc_lib.spsc_create(capacity)
+        if not self._ring:
+            raise MemoryError(f"Could not allocate SPSC ring of {capacity} slots")
+        
+        self._out = ctypes.c_double()
+    
+    def enqueue(self, item: float) -> bool:
+        """Enqueue item (returns False if full)"""
+        return _spsc_lib.push_double(self._ring, item) == 1
+    
+    def dequeue(self) -> Optional[float]:
+        """Dequeue item (returns None if empty)"""
+        if _spsc_lib.pop_double(self._ring, ctypes.byref(self._out)):
+            return self._out.value
+        return None
+    
+    def enqueue_bulk(self, values: np.ndarray) -> int:
+        """Enqueue as many values as fit, returns the number enqueued"""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        return _spsc_lib.push_bulk(self._ring, values.ctypes.data, values.size)
+    
+    def dequeue_bulk(self, out: np.ndarray) -> int:
+        """Fill a contiguous float64 array, returns the number dequeued"""
+        assert out.dtype == np.float64 and out.flags['C_CONTIGUOUS']
+        return _spsc_lib.pop_bulk(self._ring, out.ctypes.data, out.size)
+    
+    def size(self) -> int:
+        """Number of queued items"""
+        return _spsc_lib.spsc_size(self._ring)
+    
+    def close(self):
+        """Free the native ring"""
+        if self._ring:
+            _spsc_lib.spsc_destroy(self._ring)
+            self._ring = None
+    
+    def __del__(self):
+        if getattr(self, '_ring', None):
+            self.close()
 
 class CPUCacheOptimizer:
     """CPU cache optimization for hot trading paths"""
@@ -211,6 +511,11 @@ class CPUCacheOptimizer:
         if 0 <= symbol_idx < len(self.hot_prices):
             self.hot_prices[symbol_idx] = price
     
+    def update_hot_prices(self, symbol_idx: np.ndarray, prices: np.ndarray):
+        """Vectorized update_hot_price for a batch of ticks (last tick wins)"""
+        in_range = (symbol_idx >= 0) & (symbol_idx < len(self.hot_prices))
+        self.hot_prices[symbol_idx[in_range]] = prices[in_range]
+    
     def get_hot_price(self, symbol_idx: int) -> float:
         """Get hot price data (L1 cache hit)"""
         if 0 <= symbol_idx < len(self.hot_prices):
@@ -218,21 +523,42 @@ class CPUCacheOptimizer:
         return 0.0
     
     def prefetch_data(self, memory_address: int):
-        """Software prefetch for predictable access patterns"""
-        try:
-            # This would use compiler intrinsics in C/C++
-            # In Python, we simulate by touching the memory
-            ctypes.c_void_p(memory_address).contents
-        except:
-            pass  # Prefetch failed, not critical
+        """Software prefetch for predictable access patterns.
+        
+        Issues PREFETCHT0 through the native helper; a no-op when the
+        extension is not built (prefetching is only a hint).
+        """
+        if PREFETCH_AVAILABLE and memory_address:
+            _prefetch_lib.prefetch_t0(memory_address)
 
 class AdvancedMemoryManager:
     """Advanced memory management for ultra-low latency trading"""
     
-    def __init__(self):
-        self.zero_alloc_engine = ZeroAllocTradingEngine()
+    __slots__ = (
+        'zero_alloc_engine', 'cache_optimizer', '_counter_batch',
+        'tick_queue', 'signal_queue', 'order_queue',
+        'tick_file_size', 'tick_fd', 'tick_mmap',
+        'tick_store', 'tick_store_count', 'tick_size', 'last_price', '_price_known',
+        '_saved_affinity', '_saved_scheduler'
+    )
+    
+    # Hot-path counter indices (resolved once, not through zero_alloc_engine)
+    _HITS = ZeroAllocTradingEngine.COUNTER_CACHE_HITS
+    _MISSES = ZeroAllocTradingEngine.COUNTER_CACHE_MISSES
+    
+    def __init__(self, numa_node: int = 0, tick_size: float = 0.01):
+        self.zero_alloc_engine = ZeroAllocTradingEngine(numa_node=numa_node)
         self.cache_optimizer = CPUCacheOptimizer()
         
+        # Delta-encoding state for the packed tick tape
+        self.tick_size = tick_size
+        self.last_price = np.zeros(self.zero_alloc_engine.max_symbols, dtype=np.float64)
+        self._price_known = np.zeros(self.zero_alloc_engine.max_symbols, dtype=np.bool_)
+        
+        # Local counter increments, flushed to the shared counters on read.
+        # Ticks processed is derived at flush time (every tick is a hit or a miss)
+        self._counter_batch = np.zeros(8, dtype=np.uint64)
+        
         # Lock-free queues for different data types
         self.tick_queue = LockFreeQueue(8192)  # 8K ticks
         self.signal_queue = LockFreeQueue(1024)  # 1K signals
@@ -241,89 +567,244 @@ class AdvancedMemoryManager:
         # Memory-mapped files for persistence
         self.setup_memory_mapped_storage()
         
+        # Scheduling state saved by pin_to_core
+        self._saved_affinity = None
+        self._saved_scheduler = None
+        
         print("🚀 Advanced Memory Manager initialized")
     
+    def pin_to_core(self, core: int, realtime_priority: int = 50) -> bool:
+        """Pin the calling thread to one core and request SCHED_FIFO"""
+        try:
+            self._saved_affinity = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {core})
+            print(f"🎯 Thread pinned to CPU {core}")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not set CPU affinity: {e}")
+            self._saved_affinity = None
+            return False
+        
+        # Keep the core on the same NUMA node as the memory pools
+        if NUMA_AVAILABLE:
+            core_node = _libnuma.numa_node_of_cpu(core)
+            if core_node >= 0 and core_node != self.zero_alloc_engine.numa_node:
+                print(f"⚠️ CPU {core} is on NUMA node {core_node}, "
+                      f"pools are on node {self.zero_alloc_engine.numa_node}")
+        
+        try:
+            policy = os.sched_getscheduler(0)
+            param = os.sched_getparam(0)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(realtime_priority))
+            self._saved_scheduler = (policy, param)
+            print(f"⚡ SCHED_FIFO priority {realtime_priority}")
+        except PermissionError:
+            print("⚠️ SCHED_FIFO requires root (CAP_SYS_NICE), using default scheduler")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not set real-time scheduler: {e}")
+        
+        return True
+    
+    def release_core(self):
+        """Restore the affinity and scheduler in place before pin_to_core"""
+        if self._saved_scheduler is not None:
+            policy, param = self._saved_scheduler
+            try:
+                os.sched_setscheduler(0, policy, param)
+            except OSError:
+                pass
+            self._saved_scheduler = None
+        
+        if self._saved_affinity is not None:
+            try:
+                os.sched_setaffinity(0, self._saved_affinity)
+            except OSError:
+                pass
+            self._saved_affinity = None
+    
     def setup_memory_mapped_storage(self):
         """Setup memory-mapped files for persistent storage"""
         try:
             # Create memory-mapped file for tick storage
             self.tick_file_size = 100 * 1024 * 1024  # 100MB
-            self.tick_file = open('/tmp/trading_ticks.dat', 'w+b')
-            self.tick_file.write(b'\x00' * self.tick_file_size)
-            self.tick_file.flush()
+            self.tick_fd = os.open('/tmp/trading_ticks.dat', os.O_RDWR | os.O_CREAT, 0o600)
+            
+            # Reserve blocks without writing them from Python
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(self.tick_fd, 0, self.tick_file_size)
+            else:
+                os.ftruncate(self.tick_fd, self.tick_file_size)
             
+            # MAP_POPULATE pre-faults every page in the kernel
             self.tick_mmap = mmap.mmap(
-                self.tick_file.fileno(), 
+                self.tick_fd,
                 self.tick_file_size,
-                access=mmap.ACCESS_WRITE
+                flags=mmap.MAP_SHARED | MAP_POPULATE,
+                prot=mmap.PROT_READ | mmap.PROT_WRITE
             )
             
-            print("   ✅ Memory-mapped tick storage: 100MB")
+            # Packed tick tape over the mapping
+            self.tick_store = np.frombuffer(self.tick_mmap, dtype=PACKED_TICK_DTYPE)
+            self.tick_store_count = 0
+            
+            print(f"   ✅ Memory-mapped tick storage: 100MB ({len(self.tick_store):,} packed ticks)")
             
         except Exception as e:
             print(f"   ⚠️ Memory mapping failed: {e}")
             self.tick_mmap = None
+            self.tick_store = None
+            self.tick_store_count = 0
+    
+    def store_tick(self, symbol_idx: int, price: float, size: float, timestamp_ns: int) -> bool:
+        """Append a delta-encoded tick to the mmap tape (returns False if full)"""
+        store = self.tick_store
+        if store is None:
+            return False
+        
+        pos = self.tick_store_count
+        delta = 0
+        keyframe = not self._price_known[symbol_idx]
+        if not keyframe:
+            delta = round((price - self.last_price[symbol_idx]) / self.tick_size)
+            keyframe = not -32768 <= delta <= 32767
+        
+        if pos + keyframe >= len(store):
+            return False
+        
+        if keyframe:
+            # Absolute price resets the symbol's base; the tick itself is delta 0
+            store[pos] = (np.float64(price).view(np.uint64), 0, 0.0,
+                          symbol_idx | TICK_KEYFRAME_FLAG)
+            pos += 1
+            delta = 0
+            self.last_price[symbol_idx] = price
+            self._price_known[symbol_idx] = True
+        else:
+            # Track the quantized price so rounding errors never accumulate
+            self.last_price[symbol_idx] += delta * self.tick_size
+        
+        store[pos] = (timestamp_ns, delta, size, symbol_idx)
+        self.tick_store_count = pos + 1
+        return True
+    
+    def load_ticks(self) -> Dict[str, np.ndarray]:
+        """Decode the tick tape into symbol/price/size/timestamp columns"""
+        if self.tick_store is None:
+            return {'symbol': np.empty(0, np.uint16), 'price': np.empty(0),
+                    'size': np.empty(0, np.float32), 'timestamp': np.empty(0, np.uint64)}
+        
+        records = self.tick_store[:self.tick_store_count]
+        is_keyframe = (records['sym'] & TICK_KEYFRAME_FLAG) != 0
+        symbols = records['sym'] & (TICK_KEYFRAME_FLAG - 1)
+        keyframe_price = records['ts'].view(np.float64)
+        
+        prices = np.empty(len(records), dtype=np.float64)
+        for sym in np.unique(symbols):
+            rows = np.flatnonzero(symbols == sym)
+            sym_keyframe = is_keyframe[rows]
+            
+            # Base price = most recent keyframe, plus deltas accumulated since it
+            last_keyframe = np.maximum.accumulate(np.where(sym_keyframe, np.arange(len(rows)), 0))
+            steps = records['price_delta'][rows].astype(np.int64)
+            cumulative = np.cumsum(steps)
+            since_keyframe = cumulative - cumulative[last_keyframe]
+            prices[rows] = keyframe_price[rows][last_keyframe] + since_keyframe * self.tick_size
+        
+        ticks = ~is_keyframe
+        return {
+            'symbol': symbols[ticks],
+            'price': prices[ticks],
+            'size': records['size'][ticks],
+            'timestamp': records['ts'][ticks]
+        }
     
     def process_tick_zero_alloc(self, symbol_idx: int, price: float, size: float) -> bool:
         """Process tick with zero memory allocation"""
         
+        batch = self._counter_batch
+        
         # Update hot cache
         self.cache_optimizer.update_hot_price(symbol_idx, price)
         
-        # Increment performance counter (atomic)
-        self.zero_alloc_engine.performance_counters[
-            self.zero_alloc_engine.COUNTER_TICKS_PROCESSED
-        ] += 1
-        
         # Add to lock-free queue
         if not self.tick_queue.enqueue(price):
             # Queue full, increment miss counter
-            self.zero_alloc_engine.performance_counters[
-                self.zero_alloc_engine.COUNTER_CACHE_MISSES
-            ] += 1
+            batch[self._MISSES] += 1
             return False
         
         # Cache hit
-        self.zero_alloc_engine.performance_counters[
-            self.zero_alloc_engine.COUNTER_CACHE_HITS
-        ] += 1
+        batch[self._HITS] += 1
         
         return True
     
+    def process_ticks_zero_alloc(self, symbol_idx: np.ndarray, prices: np.ndarray,
+                                 sizes: np.ndarray) -> int:
+        """Process a batch of ticks with one bulk enqueue.
+        
+        Returns the number of ticks accepted by the tick queue.
+        """
+        batch = self._counter_batch
+        
+        # Update hot cache
+        self.cache_optimizer.update_hot_prices(symbol_idx, prices)
+        
+        accepted = self.tick_queue.enqueue_bulk(prices)
+        batch[self._HITS] += accepted
+        batch[self._MISSES] += prices.size - accepted
+        
+        return accepted
+    
+    def flush_counters(self):
+        """Publish batched counter increments to the shared counter pool"""
+        engine = self.zero_alloc_engine
+        batch = self._counter_batch
+        batch[engine.COUNTER_TICKS_PROCESSED] = (
+            batch[engine.COUNTER_CACHE_HITS] + batch[engine.COUNTER_CACHE_MISSES]
+        )
+        engine.performance_counters[:len(batch)] += batch
+        batch.fill(0)
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get memory performance statistics"""
-        counters = self.zero_alloc_engine.performance_counters
+        self.flush_counters()
+        engine = self.zero_alloc_engine
         
-        total_operations = counters[self.zero_alloc_engine.COUNTER_CACHE_HITS] + \
-                          counters[self.zero_alloc_engine.COUNTER_CACHE_MISSES]
+        # One gather + one native conversion for all counters
+        ticks, signals, orders, hits, misses = (
+            engine.performance_counters[engine.STATS_COUNTER_INDEX].tolist()
+        )
         
-        cache_hit_rate = (counters[self.zero_alloc_engine.COUNTER_CACHE_HITS] / 
-                         max(total_operations, 1))
+        cache_hit_rate = hits / max(hits + misses, 1)
         
         return {
             'memory_pools': {
-                'total_allocated_mb': self.zero_alloc_engine.total_memory_mb,
-                'pools_count': len(self.zero_alloc_engine.memory_pools)
+                'total_allocated_mb': engine.total_memory_mb,
+                'pools_count': len(engine.memory_pools)
             },
             'performance_counters': {
-                'ticks_processed': int(counters[self.zero_alloc_engine.COUNTER_TICKS_PROCESSED]),
-                'signals_generated': int(counters[self.zero_alloc_engine.COUNTER_SIGNALS_GENERATED]),
-                'orders_sent': int(counters[self.zero_alloc_engine.COUNTER_ORDERS_SENT]),
+                'ticks_processed': ticks,
+                'signals_generated': signals,
+                'orders_sent': orders,
                 'cache_hit_rate': cache_hit_rate
             },
             'queue_status': {
-                'tick_queue_size': self.tick_queue.head.value - self.tick_queue.tail.value,
-                'signal_queue_size': self.signal_queue.head.value - self.signal_queue.tail.value,
-                'order_queue_size': self.order_queue.head.value - self.order_queue.tail.value
+                'tick_queue_size': self.tick_queue.size(),
+                'signal_queue_size': self.signal_queue.size(),
+                'order_queue_size': self.order_queue.size()
             }
         }
     
     def cleanup(self):
         """Cleanup memory resources"""
         if hasattr(self, 'tick_mmap') and self.tick_mmap:
+            # Drop the tape view first, exported buffers block close()
+            self.tick_store = None
             self.tick_mmap.close()
-        if hasattr(self, 'tick_file') and self.tick_file:
-            self.tick_file.close()
+        if getattr(self, 'tick_fd', None) is not None:
+            os.close(self.tick_fd)
+            self.tick_fd = None
+        
+        for queue in (self.tick_queue, self.signal_queue, self.order_queue):
+            queue.close()
         
         print("✅ Memory resources cleaned up")
 
@@ -336,22 +817,27 @@ def benchmark_memory_optimizations():
     
     manager = AdvancedMemoryManager()
     
+    # Deterministic latency: no migrations mid-run
+    manager.pin_to_core(int(os.environ.get('TRADER_CORE', '3')))
+    
     # Benchmark tick processing
     num_ticks = 100000
     symbols = 10
+    batch_size = 1000
     
     print(f"📊 Processing {num_ticks} ticks across {symbols} symbols...")
     
     start_time = time.perf_counter()
     
-    for i in range(num_ticks):
-        symbol_idx = i % symbols
-        price = 45000 + np.random.normal(0, 100)
-        size = np.random.exponential(0.1)
-        
-        success = manager.process_tick_zero_alloc(symbol_idx, price, size)
-        if not success and i % 10000 == 0:
-            print(f"   Queue full at tick {i}")
+    for i in range(0, num_ticks, batch_size):
+        n = min(batch_size, num_ticks - i)
+        symbol_idx = np.arange(i, i + n) % symbols
+        prices = 45000 + np.random.normal(0, 100, n)
+        sizes = np.random.exponential(0.1, n)
+        
+        accepted = manager.process_ticks_zero_alloc(symbol_idx, prices, sizes)
+        if accepted < n and i % 10000 == 0:
+            print(f"   Queue full at tick {i + accepted}")
     
     end_time = time.perf_counter()
     
@@ -375,6 +861,7 @@ def benchmark_memory_optimizations():
     print(f"     Order Queue: {queues['order_queue_size']}/512")
     
     # Cleanup
+    manager.release_core()
     manager.cleanup()
     
     return manager
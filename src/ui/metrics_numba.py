@@ -0,0 +1,60 @@
+"""
+Prediction Metric Kernels
+=========================
+JIT-compiled rollups over the dashboard's SoA prediction history.
+Falls back to plain Python when numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import jit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def jit(*args, **kwargs):
+        """No-op stand-in for numba.jit"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Signal codes shared with RingSoA 'signal' columns
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_HOLD = 0
+
+@jit(nopython=True, cache=True, fastmath=True)
+def prediction_rollup(predicted: np.ndarray, actual: np.ndarray, window: int):
+    """Accuracy, directional precision and rolling accuracy in one pass.
+    
+    predicted/actual hold signal codes (chronological). Precision counts only
+    directional calls (BUY/SELL). rolling[i] is the hit rate over the last
+    `window` predictions ending at i.
+    """
+    n = len(predicted)
+    rolling = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return 0.0, 0.0, rolling
+    
+    hits = 0
+    directional = 0
+    directional_hits = 0
+    window_hits = 0
+    
+    for i in range(n):
+        hit = 1 if predicted[i] == actual[i] else 0
+        hits += hit
+        window_hits += hit
+        
+        if predicted[i] != SIGNAL_HOLD:
+            directional += 1
+            directional_hits += hit
+        
+        if i >= window:
+            window_hits -= 1 if predicted[i - window] == actual[i - window] else 0
+        
+        rolling[i] = window_hits / min(i + 1, window)
+    
+    precision = directional_hits / directional if directional > 0 else 0.0
+    return hits / n, precision, rolling
@@ -0,0 +1,136 @@
+"""
+Structure-of-Arrays Ring Buffers
+================================
+Fixed-capacity record history kept as parallel NumPy columns, shared by
+the dashboards.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+import numpy as np
+
+try:
+    from .metrics_numba import SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+except ImportError:
+    from metrics_numba import SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+
+def _to_epoch(value) -> float:
+    """Epoch seconds from an ISO string, datetime or number"""
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+class RingSoA:
+    """Fixed-capacity ring of flat records stored as parallel NumPy columns.
+    
+    Drop-in for deque(maxlen=capacity) of dicts: append() takes a dict and
+    iteration yields dicts, oldest first. append_values() writes straight
+    into the preallocated slots without building a dict. Column kinds:
+      'f8' / 'i8' / ...  numeric, stored as-is (missing keys store 0)
+      'str'              interned into a small table, stored as int16 index
+      'signal'           BUY/SELL/HOLD stored as int8 code (1/-1/0)
+      'iso'              epoch float64, rendered back as an ISO-8601 string
+    Keys without a column are dropped.
+    """
+    
+    __slots__ = ('capacity', 'kinds', 'columns', '_strings', '_cursor', '_count', 'version', 'appended')
+    
+    SIGNAL_CODES = {'BUY': SIGNAL_BUY, 'SELL': SIGNAL_SELL, 'HOLD': SIGNAL_HOLD}
+    SIGNAL_NAMES = {code: name for name, code in SIGNAL_CODES.items()}
+    
+    def __init__(self, capacity: int, columns: Dict[str, str]):
+        self.capacity = capacity
+        self.kinds = dict(columns)
+        self.columns = {}
+        self._strings = {}
+        for name, kind in self.kinds.items():
+            if kind == 'str':
+                self.columns[name] = np.zeros(capacity, dtype=np.int16)
+                self._strings[name] = ([], {})
+            elif kind == 'iso':
+                self.columns[name] = np.zeros(capacity, dtype=np.float64)
+            elif kind == 'signal':
+                self.columns[name] = np.zeros(capacity, dtype=np.int8)
+            else:
+                self.columns[name] = np.zeros(capacity, dtype=kind)
+        self._cursor = 0
+        self._count = 0
+        self.version = 0  # Bumped on every mutation, for derived caches
+        self.appended = 0  # Total records ever appended (sequence of the newest)
+    
+    def _intern(self, name: str, value) -> int:
+        table, index = self._strings[name]
+        value = '' if value is None else str(value)
+        idx = index.get(value)
+        if idx is None:
+            idx = index[value] = len(table)
+            table.append(value)
+        return idx
+    
+    def append(self, record: Dict[str, Any]):
+        self.append_values(*[record.get(name) for name in self.kinds])
+    
+    def append_values(self, *values):
+        """Write one record in place at the cursor, values in column order"""
+        i = self._cursor
+        for (name, kind), value in zip(self.kinds.items(), values):
+            if kind == 'str':
+                self.columns[name][i] = self._intern(name, value)
+            elif kind == 'iso':
+                self.columns[name][i] = _to_epoch(value)
+            elif kind == 'signal':
+                self.columns[name][i] = self.SIGNAL_CODES.get(value, SIGNAL_HOLD)
+            else:
+                self.columns[name][i] = value or 0
+        self._cursor = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.version += 1
+        self.appended += 1
+    
+    def clear(self):
+        self._cursor = 0
+        self._count = 0
+        self.version += 1
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _order(self, last_k: Optional[int] = None) -> np.ndarray:
+        """Physical slot indices in chronological order"""
+        n = self._count if last_k is None else min(last_k, self._count)
+        return (self._cursor - n + np.arange(n)) % self.capacity
+    
+    def column(self, name: str, last_k: Optional[int] = None) -> np.ndarray:
+        """Chronological copy of one column (raw stored values)"""
+        return self.columns[name][self._order(last_k)]
+    
+    def since(self, seq: int) -> List[Dict[str, Any]]:
+        """Records appended after sequence number `seq` (still in the ring), oldest first"""
+        new = self.appended - seq
+        return self.tail(new) if new > 0 else []
+    
+    def tail(self, last_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent records as dicts, oldest first"""
+        order = self._order(last_k)
+        decoded = {}
+        for name, kind in self.kinds.items():
+            values = self.columns[name][order].tolist()
+            if kind == 'str':
+                table = self._strings[name][0]
+                values = [table[v] for v in values]
+            elif kind == 'iso':
+                values = [datetime.fromtimestamp(v).isoformat() for v in values]
+            elif kind == 'signal':
+                values = [self.SIGNAL_NAMES[v] for v in values]
+            decoded[name] = values
+        
+        names = list(decoded)
+        return [dict(zip(names, row)) for row in zip(*decoded.values())]
+    
+    def __iter__(self):
+        return iter(self.tail())
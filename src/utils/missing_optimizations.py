@@ -11,7 +11,7 @@ import asyncio
 import numpy as np
 import pandas as pd
 from collections import deque, defaultdict
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 import time
 import aiohttp
 from functools import lru_cache
@@ -318,25 +318,57 @@ class IncrementalIndicatorEngine:
         }
 
 # 4. ADAPTIVE THRESHOLD MANAGEMENT
+class TradeResult:
+    """Compact trade record (slots, no per-trade dict)"""
+    __slots__ = ('pnl', 'profitable', 'signal_strength', 'market_conditions', 'timestamp')
+    
+    def __init__(self, pnl: float, signal_strength: float, market_conditions: Dict, timestamp: float):
+        self.pnl = pnl
+        self.profitable = pnl > 0
+        self.signal_strength = signal_strength
+        self.market_conditions = market_conditions
+        self.timestamp = timestamp
+
 class AdaptiveThresholdManager:
     """Self-adjusting entry criteria based on recent performance"""
     
     def __init__(self, lookback_trades: int = 20):
         self.recent_trades = deque(maxlen=lookback_trades)
         self.win_rate_threshold = 0.55  # Target win rate
-        self.performance_history = deque(maxlen=100)
+        
+        # Running sums over recent_trades, updated on append/evict (no rescans)
+        self.recent_wins = 0
+        self.recent_losses = 0
+        self.sum_wins = 0.0
+        self.sum_losses = 0.0
+        
+        # Trade-derived stats, rebuilt only after a new trade result
+        self._stats_cache: Optional[Dict[str, float]] = None
+        self.last_trade_time = 0.0
         
     def add_trade_result(self, pnl: float, entry_signal_strength: float, market_conditions: Dict):
         """Record trade result for learning"""
-        trade_result = {
-            'pnl': pnl,
-            'profitable': pnl > 0,
-            'signal_strength': entry_signal_strength,
-            'market_conditions': market_conditions,
-            'timestamp': time.time()
-        }
+        now = time.time()
+        trade_result = TradeResult(pnl, entry_signal_strength, market_conditions, now)
+        
+        # Window full: the oldest trade drops out of the running sums
+        if len(self.recent_trades) == self.recent_trades.maxlen:
+            self._update_sums(self.recent_trades[0], -1)
+        
         self.recent_trades.append(trade_result)
-        self.performance_history.append(trade_result)
+        self._update_sums(trade_result, 1)
+        self._stats_cache = None
+        self.last_trade_time = now
+    
+    def _update_sums(self, trade_result: TradeResult, sign: int):
+        """Add (sign=1) or remove (sign=-1) a trade from the running sums"""
+        # An emptied side resets to exactly 0.0 so evictions can't leave float residue
+        if trade_result.profitable:
+            self.recent_wins += sign
+            self.sum_wins = self.sum_wins + sign * trade_result.pnl if self.recent_wins else 0.0
+        else:
+            self.recent_losses += sign
+            self.sum_losses = self.sum_losses + sign * trade_result.pnl if self.recent_losses else 0.0
     
     def get_dynamic_threshold(self, base_threshold: float, market_regime: str = "NEUTRAL") -> float:
         """Adjust threshold based on recent win rate and market conditions"""
@@ -344,8 +376,7 @@ class AdaptiveThresholdManager:
             return base_threshold
         
         # Calculate recent performance
-        recent_wins = sum(1 for t in self.recent_trades if t['profitable'])
-        current_win_rate = recent_wins / len(self.recent_trades)
+        current_win_rate = self.recent_wins / len(self.recent_trades)
         
         # Base adjustment based on win rate
         if current_win_rate > 0.65:
@@ -371,13 +402,9 @@ class AdaptiveThresholdManager:
         regime_adj = regime_adjustments.get(market_regime, 1.0)
         
         # Time-based adjustment (avoid overtrading)
-        recent_trade_times = [t['timestamp'] for t in self.recent_trades]
-        if recent_trade_times:
-            time_since_last = time.time() - max(recent_trade_times)
-            if time_since_last < 300:  # Less than 5 minutes
-                time_adj = 1.1  # Slightly higher threshold
-            else:
-                time_adj = 1.0
+        time_since_last = time.time() - self.last_trade_time
+        if time_since_last < 300:  # Less than 5 minutes
+            time_adj = 1.1  # Slightly higher threshold
         else:
             time_adj = 1.0
         
@@ -408,16 +435,21 @@ class AdaptiveThresholdManager:
         if not self.recent_trades:
             return {}
         
-        profitable_trades = [t for t in self.recent_trades if t['profitable']]
-        losing_trades = [t for t in self.recent_trades if not t['profitable']]
+        if self._stats_cache is None:
+            total_trades = len(self.recent_trades)
+            losses = self.recent_losses
+            loss_total = abs(self.sum_losses)
+            self._stats_cache = {
+                'win_rate': self.recent_wins / total_trades,
+                'total_trades': total_trades,
+                'avg_win': self.sum_wins / self.recent_wins if self.recent_wins else 0,
+                'avg_loss': self.sum_losses / losses if losses else 0,
+                'profit_factor': self.sum_wins / loss_total if loss_total else float('inf'),
+            }
         
+        # Threshold adjustment depends on time since the last trade, so it stays live
         return {
-            'win_rate': len(profitable_trades) / len(self.recent_trades),
-            'total_trades': len(self.recent_trades),
-            'avg_win': np.mean([t['pnl'] for t in profitable_trades]) if profitable_trades else 0,
-            'avg_loss': np.mean([t['pnl'] for t in losing_trades]) if losing_trades else 0,
-            'profit_factor': (sum(t['pnl'] for t in profitable_trades) / 
-                            abs(sum(t['pnl'] for t in losing_trades))) if losing_trades else float('inf'),
+            **self._stats_cache,
             'current_threshold_adjustment': self.get_dynamic_threshold(1.0) - 1.0
         }
 
@@ -788,6 +820,13 @@ class EnhancedPerformanceMonitor:
         return True
 
 # 8. MARKET MICROSTRUCTURE ANALYSIS
+class TradeTick(NamedTuple):
+    """Single trade in the microstructure flow (tuple, no per-trade dict)"""
+    price: float
+    quantity: float
+    is_buyer_maker: bool
+    timestamp: float
+
 class MicrostructureAnalyzer:
     """Analyze market microstructure for better timing"""
     
@@ -798,12 +837,7 @@ class MicrostructureAnalyzer:
         
     def add_trade(self, price: float, quantity: float, is_buyer_maker: bool, timestamp: float):
         """Add trade data"""
-        self.trade_flow.append({
-            'price': price,
-            'quantity': quantity,
-            'is_buyer_maker': is_buyer_maker,
-            'timestamp': timestamp
-        })
+        self.trade_flow.append(TradeTick(price, quantity, is_buyer_maker, timestamp))
     
     def add_book_update(self, bids: List[Tuple[float, float]], asks: List[Tuple[float, float]]):
         """Add order book update"""
@@ -820,8 +854,8 @@ class MicrostructureAnalyzer:
         
         recent_trades = list(self.trade_flow)[-lookback:]
         
-        buy_volume = sum(t['quantity'] for t in recent_trades if not t['is_buyer_maker'])
-        sell_volume = sum(t['quantity'] for t in recent_trades if t['is_buyer_maker'])
+        buy_volume = sum(t.quantity for t in recent_trades if not t.is_buyer_maker)
+        sell_volume = sum(t.quantity for t in recent_trades if t.is_buyer_maker)
         total_volume = buy_volume + sell_volume
         
         if total_volume == 0:
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test Adaptive Threshold Running Sums
+====================================
+Verifies the sliding-window win/loss sums stay exact across evictions
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+def test_profit_factor_after_all_losses_evicted():
+    """Evicting every loss must leave profit_factor == inf, not 1/float-residue"""
+    try:
+        from utils.missing_optimizations import AdaptiveThresholdManager
+    except ImportError as e:
+        print(f"⚠️ Skipping, missing dependency: {e}")
+        return
+
+    for pnls in ([-0.1, -0.2, -0.3, 1, 1, 1], [-0.3, -0.2, -0.1, 1, 1, 1]):
+        manager = AdaptiveThresholdManager(lookback_trades=3)
+        for pnl in pnls:
+            manager.add_trade_result(pnl, 0.8, {})
+
+        stats = manager.get_performance_stats()
+        assert manager.sum_losses == 0.0, manager.sum_losses
+        assert stats['profit_factor'] == float('inf'), stats['profit_factor']
+        assert stats['avg_loss'] == 0
+        assert stats['win_rate'] == 1.0
+
+    print("✅ Running sums reset exactly when a side empties")
+
+def test_running_sums_match_window():
+    """Running sums equal a fresh rescan of the window"""
+    try:
+        from utils.missing_optimizations import AdaptiveThresholdManager
+    except ImportError as e:
+        print(f"⚠️ Skipping, missing dependency: {e}")
+        return
+
+    manager = AdaptiveThresholdManager(lookback_trades=5)
+    for pnl in [2.0, -1.0, 3.0, -0.5, 1.5, -2.0, 0.0, 4.0]:
+        manager.add_trade_result(pnl, 0.8, {})
+
+    wins = [t.pnl for t in manager.recent_trades if t.profitable]
+    losses = [t.pnl for t in manager.recent_trades if not t.profitable]
+    stats = manager.get_performance_stats()
+
+    assert abs(manager.sum_wins - sum(wins)) < 1e-12
+    assert abs(manager.sum_losses - sum(losses)) < 1e-12
+    assert stats['win_rate'] == len(wins) / len(manager.recent_trades)
+    assert abs(stats['profit_factor'] - sum(wins) / abs(sum(losses))) < 1e-12
+
+    print("✅ Running sums match the trade window")
+
+if __name__ == "__main__":
+    print("🔥 Adaptive Threshold Test Suite")
+    print("=" * 60)
+
+    test_profit_factor_after_all_losses_evicted()
+    test_running_sums_match_window()